@@ -59,10 +59,18 @@ class UserDatabase {
     addUser(userData) {
         const users = this.getAllUsers();
 
-        // Check if user already exists
-        const existingUser = this.findUser(userData.username) || this.findUser(userData.email);
-        if (existingUser) {
-            return { success: false, message: 'User already exists' };
+        // Check username and email against existing users in a single pass
+        const username = userData.username.toLowerCase();
+        const email = userData.email.toLowerCase();
+        for (const user of users) {
+            const existingName = user.username.toLowerCase();
+            const existingEmail = user.email.toLowerCase();
+            if (existingName === username || existingEmail === username) {
+                return { success: false, message: 'Username already taken' };
+            }
+            if (existingName === email || existingEmail === email) {
+                return { success: false, message: 'Email already registered' };
+            }
         }
 
         const newUser = {
@@ -79,17 +87,30 @@ class UserDatabase {
     authenticate(identifier, password) {
         const user = this.findUser(identifier);
         if (!user) {
+            // Still do a comparison so unknown users take as long as known ones
+            this.passwordsMatch(password, 'not-a-real-password');
             return { success: false, message: 'User not found' };
         }
 
         // In a real app, you would compare hashed passwords
-        if (user.password !== password) {
+        if (!this.passwordsMatch(password, user.password)) {
             return { success: false, message: 'Incorrect password' };
         }
 
         return { success: true, user };
     }
 
+    // Compare passwords without stopping at the first different character
+    passwordsMatch(input, stored) {
+        if (typeof input !== 'string' || typeof stored !== 'string') return false;
+
+        let diff = input.length ^ stored.length;
+        for (let i = 0; i < input.length; i++) {
+            diff |= input.charCodeAt(i) ^ stored.charCodeAt(i);
+        }
+        return diff === 0;
+    }
+
     // Set current user
     setCurrentUser(user) {
         // Don't store password in session